@@ -138,6 +138,19 @@ class TimeBinner:
 
         return out
 
+    def _reshape_view(self, arr, n_bin=None):
+        """
+        Like `reshape` (with no padding), but returns a view of `arr`
+        (rather than a copy) when `n_bin` is an integer. This is for
+        reductions over the bins, so the result must not be modified
+        in-place.
+        """
+        n_bin = self._parse_nbin(n_bin)
+        if np.mod(n_bin, 1) != 0:
+            return self.reshape(arr, n_bin=n_bin)
+        shp = self._outshape(arr.shape, n_bin=n_bin)
+        return arr[..., :(shp[-2] * shp[-1])].reshape(shp, order='C')
+
     def _detrend(self, dat, n_pad=0, n_bin=None):
         """
         Reshape the array `dat` and remove the best-fit trend line.
@@ -170,7 +183,7 @@ class TimeBinner:
         if axis != -1:
             dat = np.swapaxes(dat, axis, -1)
         n_bin = self._parse_nbin(n_bin)
-        tmp = self.reshape(dat, n_bin=n_bin)
+        tmp = self._reshape_view(dat, n_bin=n_bin)
         
         return np.nanmean(tmp,-1)
 
@@ -205,7 +218,7 @@ class TimeBinner:
         
         Returns a numpy.ndarray
         '''
-        return self.reshape(dat, n_bin=n_bin).var(-1)
+        return self._reshape_view(dat, n_bin=n_bin).var(-1)
 
 
     def _std(self, dat, n_bin=None):
@@ -214,7 +227,7 @@ class TimeBinner:
         
         Returns a numpy.ndarray
         '''
-        return self.reshape(dat, n_bin=n_bin).std(-1)
+        return self._reshape_view(dat, n_bin=n_bin).std(-1)
     
     def _new_coords(self, array):
         '''
@@ -266,6 +279,8 @@ class TimeBinner:
             props['n_fft'] = self.n_fft
         if names is None:
             names = rawdat.data_vars
+        # The binned time coordinates are shared by many variables
+        time_coords = {}
             
         for ky in names:
             # set up dimensions and coordinates for Dataset
@@ -273,7 +288,9 @@ class TimeBinner:
             coords_dict = {}
             for nm in dims_list:
                 if 'time' in nm:
-                    coords_dict[nm] = self._mean(rawdat[ky][nm].values)
+                    if nm not in time_coords:
+                        time_coords[nm] = self._mean(rawdat[ky][nm].values)
+                    coords_dict[nm] = time_coords[nm]
                 else:
                     coords_dict[nm] = rawdat[ky][nm].values
                     
@@ -286,14 +303,14 @@ class TimeBinner:
             except:
                 pass
             
-            # +1 for standard deviation
-            std = (np.std(self.reshape(rawdat.Veldata.U_mag.values), axis=-1,
-                          dtype=np.float64) - (noise[0] + noise[1])/2)
-            out['U_std'] = xr.DataArray(
-                        std,
-                        dims=rawdat.vel.dims[1:],
-                        attrs={'units':'m/s',
-                               'description':'horizontal velocity std dev'})
+        # +1 for standard deviation
+        std = (np.std(self._reshape_view(rawdat.Veldata.U_mag.values), axis=-1,
+                      dtype=np.float64) - (noise[0] + noise[1])/2)
+        out['U_std'] = xr.DataArray(
+                    std,
+                    dims=rawdat.vel.dims[1:],
+                    attrs={'units':'m/s',
+                           'description':'horizontal velocity std dev'})
         
         out.attrs = props
         return out
@@ -326,6 +343,8 @@ class TimeBinner:
             props['n_bin'] = self.n_bin          
         if names is None:
             names = rawdat.data_vars
+        # The binned time coordinates are shared by many variables
+        time_coords = {}
             
         for ky in names:
             # set up dimensions and coordinates for dataarray
@@ -333,7 +352,9 @@ class TimeBinner:
             coords_dict = {}
             for nm in dims_list:
                 if 'time' in nm:
-                    coords_dict[nm] = self._mean(rawdat[ky][nm].values)
+                    if nm not in time_coords:
+                        time_coords[nm] = self._mean(rawdat[ky][nm].values)
+                    coords_dict[nm] = time_coords[nm]
                 else:
                     coords_dict[nm] = rawdat[ky][nm].values
                     
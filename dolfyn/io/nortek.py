@@ -7,6 +7,8 @@ import numpy as np
 import xarray as xr
 from struct import unpack
 import warnings
+from functools import lru_cache
+import calendar
 from . import nortek_defs
 from .base import WrongFileType, read_userdata, create_dataset, handle_nan
 from .. import time
@@ -127,6 +129,19 @@ def _bitshift8(val):
     return val >> 8
 
 
+_timegm = calendar.timegm
+
+
+@lru_cache(maxsize=64)
+def _local_utcoffset(year, month, day, hour):
+    """
+    The offset (in seconds) of the local timezone from UTC during the
+    given hour, consistent with `datetime.timestamp`.
+    """
+    return (datetime(year, month, day, hour).timestamp() -
+            _timegm((year, month, day, hour, 0, 0, 0, 0, 0)))
+
+
 class NortekReader(object):
 
     """
@@ -203,6 +218,11 @@ class NortekReader(object):
                 "'endianness' of the file.  Are you sure this is a Nortek "
                 "file?")
         self.endian = endian
+        # These are used for every IMU ping, so build them once here.
+        self._ahrs_fmt = {195: endian + '6f',
+                          204: endian + '9f',
+                          211: endian + '9f6x'}
+        self._ahrs_f4 = np.dtype(endian + 'f4')
         self.f.seek(0, 0)
         # print( unpack(self.endian+'HH',self.read(4)) )
         # This is the configuration data:
@@ -748,22 +768,28 @@ class NortekReader(object):
         byts = ''
         if ahrsid == 195:  # 0xc3
             byts = self.read(64)
-            dt = unpack(self.endian + '6f9f4x', byts)
+            dt = unpack(self._ahrs_fmt[195], byts[:24])
             (dat_o['angrt'][:, c],
              dat_o['accel'][:, c]) = (dt[0:3], dt[3:6],)
-            dat_o['orientmat'][:, :, c] = ((dt[6:9], dt[9:12], dt[12:15]))
+            # The orientation matrix is 9 row-major floats at byte 24
+            dat_o['orientmat'][:, :, c] = np.frombuffer(
+                byts, dtype=self._ahrs_f4, count=9, offset=24
+            ).reshape(3, 3)
         elif ahrsid == 204:  # 0xcc
             byts = self.read(78)
             # This skips the "DWORD" (4 bytes) and the AHRS checksum
             # (2 bytes)
-            dt = unpack(self.endian + '18f6x', byts)
+            dt = unpack(self._ahrs_fmt[204], byts[:36])
             (dat_o['accel'][:, c],
              dat_o['angrt'][:, c],
              dat_o['mag'][:, c]) = (dt[0:3], dt[3:6], dt[6:9],)
-            dat_o['orientmat'][:, :, c] = ((dt[9:12], dt[12:15], dt[15:18]))
+            # The orientation matrix is 9 row-major floats at byte 36
+            dat_o['orientmat'][:, :, c] = np.frombuffer(
+                byts, dtype=self._ahrs_f4, count=9, offset=36
+            ).reshape(3, 3)
         elif ahrsid == 211:
             byts = self.read(42)
-            dt = unpack(self.endian + '9f6x', byts)
+            dt = unpack(self._ahrs_fmt[211], byts)
             (dat_o['angrt'][:, c],
              dat_o['accel'][:, c],
              dat_o['mag'][:, c]) = (dt[0:3], dt[3:6], dt[6:9],)
@@ -813,9 +839,8 @@ class NortekReader(object):
             self._init_data(nortek_defs.awac_profile)
             self._dtypes += ['awac_profile']
 
-        # There is a 'fill' byte at the end, if nbins is odd.
         n = self.config['NBeams']
-        byts = self.read(116 + n*3 * nbins + np.mod(nbins, 2))
+        byts = self.read(self._awac_nbyte)
         c = self.c
         dat['coords']['time'][c] = self.rd_time(byts[2:8])
         (dat['sys']['Error'][c],
@@ -832,12 +857,14 @@ class NortekReader(object):
         dat['data_vars']['pressure'][c] = (65536 * p_msb + p_lsw)
         # The nortek system integrator manual specifies an 88byte 'spare'
         # field, therefore we start at 116.
-        tmp = unpack(self.endian + str(n * nbins) + 'h' +
-                     str(n * nbins) + 'B', byts[116:116 + n*3 * nbins])
-        for idx in range(n):
-            dat['data_vars']['vel'][idx, :, c] = tmp[idx * nbins: (idx + 1) * nbins]
-            dat['data_vars']['amp'][idx, :, c] = tmp[(idx + n) * nbins:
-                                                  (idx + n+1) * nbins]
+        # Casting into the (native-endian) float32 'vel' array does any
+        # byteswap needed for the file's endianness in one step.
+        dat['data_vars']['vel'][:n, :, c] = np.frombuffer(
+            byts, dtype=self._awac_i2, count=n * nbins, offset=116
+        ).reshape(n, nbins)
+        dat['data_vars']['amp'][:n, :, c] = np.frombuffer(
+            byts, dtype=np.uint8, count=n * nbins, offset=116 + 2 * n * nbins
+        ).reshape(n, nbins)
         self.checksum(byts)
         self.c += 1
         if self.debug:
@@ -926,6 +953,12 @@ class NortekReader(object):
         
         self.n_samp_guess = int(self.filesize / self.code_spacing('0x20') + 1)
         self.config['fs'] = 1. / self.config['AvgInterval']
+        # The profile size and format are fixed for the whole file.
+        # There is a 'fill' byte at the end, if nbins is odd.
+        n = self.config['NBeams']
+        nbins = self.config['NBins']
+        self._awac_nbyte = 116 + n*3 * nbins + (nbins & 1)
+        self._awac_i2 = np.dtype(self.endian + 'i2')
 
     @property
     def filesize(self,):
@@ -947,12 +980,24 @@ class NortekReader(object):
         Read the time from the first 6bytes of the input string.
         """
         min, sec, day, hour, year, month = unpack('BBBBBB', strng[:6])
-        return datetime(time._fullyear(_bcd2char(year)), 
-                        _bcd2char(month), 
-                        _bcd2char(day), 
-                        _bcd2char(hour), 
-                        _bcd2char(min), 
-                        _bcd2char(sec)).timestamp()
+        year = time._fullyear(_bcd2char(year))
+        month = _bcd2char(month)
+        day = _bcd2char(day)
+        hour = _bcd2char(hour)
+        min = _bcd2char(min)
+        sec = _bcd2char(sec)
+        # timegm doesn't range-check (e.g., 61 minutes rolls over into
+        # the next hour), so check these like datetime(...) would. The
+        # year, month, day and hour are checked by _local_utcoffset.
+        if min > 59:
+            raise ValueError("minute must be in 0..59")
+        if sec > 59:
+            raise ValueError("second must be in 0..59")
+        # The instrument clock is in local time. Rather than calling
+        # datetime(...).timestamp() (a tz lookup + mktime) every ping,
+        # offset the UTC epoch by the (cached) local offset for the hour.
+        return (_timegm((year, month, day, hour, min, sec, 0, 0, 0)) +
+                _local_utcoffset(year, month, day, hour))
         # try:
         #     return time.date2num(time.datetime(
         #         time._fullyear(_bcd2char(year)),
@@ -2,6 +2,8 @@
 
 from __future__ import print_function
 import struct
+import mmap
+import os
 import os.path as path
 import numpy as np
 #import warnings
@@ -71,7 +73,12 @@ index_dtype = {
               ('d_ver', np.uint8),
     ])
 }
-index_version = 1
+# Version 2 has the same records as version 1, but the header also
+# holds the size and modification time of the source file (see
+# `get_index`). Older versions of dolfyn can't read version 2 files
+# (they raise a KeyError); delete the .index file to re-index with them.
+index_dtype[2] = index_dtype[1]
+index_version = 2
 
 hdr = struct.Struct('<BBBBhhh')
 
@@ -96,31 +103,67 @@ def calc_time(year, month, day, hour, minute, second, usec, zero_is_bad=True):
     return dt#time.time_array(time.date2num(dt))
 
 
+_stamp = struct.Struct('<Qq')
+
+
+def _file_stamp(fname):
+    # The (size, mtime in ns) of a file, which an index must match to be
+    # reused.
+    st = os.stat(fname)
+    return st.st_size, st.st_mtime_ns
+
+
+def _read_index_head(f):
+    # Returns the (version, source-file stamp) from the header of an
+    # open index file, and leaves `f` positioned at the first record.
+    file_head = f.read(12)
+    if file_head[:10] != b'Index Ver:':
+        # This is pre-versioning the index files
+        f.seek(0, 0)
+        return None, None
+    try:
+        index_ver = struct.unpack('<H', file_head[10:])[0]
+        if index_ver < 2:
+            return index_ver, None
+        return index_ver, _stamp.unpack(f.read(_stamp.size))
+    except struct.error:
+        # A truncated header; the index is rebuilt (see `get_index`)
+        return None, None
+
+
 def create_index_slow(infile, outfile, N_ens):
-    fin = open(infile, 'rb')
-    fout = open(outfile, 'wb')
-    fout.write(b'Index Ver:')
-    fout.write(struct.pack('<H', index_version))
+    stamp = _file_stamp(infile)
+    with open(infile, 'rb') as fin, open(outfile, 'wb') as fout:
+        fout.write(b'Index Ver:')
+        fout.write(struct.pack('<H', index_version) + _stamp.pack(*stamp))
+        if stamp[0] == 0:
+            # Nothing to index (and an empty file can't be mmap'd)
+            return
+        # The source file is memory-mapped, so that the headers can be
+        # unpacked in place.
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _index_records(mm, fout, N_ens)
+
+
+def _index_records(mm, fout, N_ens):
     ens = 0
     N = 0
     config = 0
     last_ens = -1
     seek_2ens = {21: 40, 24: 40, 26: 40,
                  23: 42, 28: 40}
+    pos = 0
     while N < N_ens:
-        pos = fin.tell()
         try:
-            dat = hdr.unpack(fin.read(hdr.size))
-        except:
+            dat = hdr.unpack_from(mm, pos)
+        except struct.error:
             break
         if dat[2] in [21, 23, 24, 26, 28]:
-            d_ver, d_off, config = struct.unpack('<BBH', fin.read(4))
-            fin.seek(4, 1)
-            yr, mo, dy, h, m, s, u = struct.unpack('6BH', fin.read(8))
-            fin.seek(14, 1)
-            beams_cy = struct.unpack('<H', fin.read(2))[0]
-            fin.seek(seek_2ens[dat[2]], 1)
-            ens = struct.unpack('<I', fin.read(4))[0]
+            p = pos + hdr.size
+            d_ver, d_off, config = struct.unpack_from('<BBH', mm, p)
+            yr, mo, dy, h, m, s, u = struct.unpack_from('6BH', mm, p + 8)
+            beams_cy = struct.unpack_from('<H', mm, p + 30)[0]
+            ens = struct.unpack_from('<I', mm, p + 32 + seek_2ens[dat[2]])[0]
             if dat[2] in [23, 28]:
                 # ensemble counter is garbage(=1 ?!) for these ids
                 ens = last_ens
@@ -129,38 +172,41 @@ def create_index_slow(infile, outfile, N_ens):
             fout.write(struct.pack('<QIQ4H6BHB', N, ens, pos, dat[2],
                                    config, beams_cy, 0,
                                    yr, mo, dy, h, m, s, u, d_ver))
-            fin.seek(dat[4] - (36 + seek_2ens[dat[2]]), 1)
             last_ens = ens
-        else:
-            fin.seek(dat[4], 1)
+        pos += hdr.size + dat[4]
         # if N < 5:
         #     print('%10d: %02X, %d, %02X, %d, %d, %d, %d\n' %
         #           (pos, dat[0], dat[1], dat[2], dat[4],
         #            N, ens, last_ens))
         # else:
         #     break
-    fin.close()
-    fout.close()
 
 
 def get_index(infile, reload=False):
     index_file = infile + '.index'
+    if not reload and path.isfile(index_file):
+        # Only reuse an index that was built from this version of the
+        # file (same size and modification time).
+        with open(index_file, 'rb') as f:
+            stamp = _read_index_head(f)[1]
+        reload = stamp != _file_stamp(infile)
     if not path.isfile(index_file) or reload:
         print("Indexing...", end='')
-        create_index_slow(infile, index_file, 2 ** 32)
+        # Build the index under a temporary name, so that another
+        # process reading this file never sees a partial index.
+        tmp = '{}.{}.tmp'.format(index_file, os.getpid())
+        try:
+            create_index_slow(infile, tmp, 2 ** 32)
+            os.replace(tmp, index_file)
+        finally:
+            if path.isfile(tmp):
+                os.remove(tmp)
         print(" Done.")
     # else:
     #     print("Using saved index file.")
-    f = open(index_file, 'rb')
-    file_head = f.read(12)
-    if file_head[:10] == b'Index Ver:':
-        index_ver = struct.unpack('<H', file_head[10:])[0]
-    else:
-        # This is pre-versioning the index files
-        index_ver = None
-        f.seek(0, 0)
-    out = np.fromfile(f, dtype=index_dtype[index_ver])
-    f.close()
+    with open(index_file, 'rb') as f:
+        index_ver = _read_index_head(f)[0]
+        out = np.fromfile(f, dtype=index_dtype[index_ver])
     return out
 
 
@@ -0,0 +1,64 @@
+"""
+Kernels for rotating vectors by time-varying rotation matrices.
+
+These are compiled with numba when it is installed (``pip install
+dolfyn[numba]``), otherwise the equivalent numpy einsum is used.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _rotate_loop(rmat, dat, out, transpose):
+        # rmat is (n, n, Nt), dat and out are (n, M, Nt). The sums start
+        # in the output dtype, so float32 data is summed in float32 (as
+        # einsum does).
+        n, m, nt = dat.shape
+        for t in prange(nt):
+            for k in range(m):
+                for i in range(n):
+                    s = out.dtype.type(0)
+                    if transpose:
+                        for j in range(n):
+                            s += rmat[j, i, t] * dat[j, k, t]
+                    else:
+                        for j in range(n):
+                            s += rmat[i, j, t] * dat[j, k, t]
+                    out[i, k, t] = s
+else:
+    _rotate_loop = None
+
+
+def rotate_vectors(rmat, dat, transpose=False):
+    """
+    Rotate the vectors in `dat` by the rotation matrix at each time.
+
+    Parameters
+    ----------
+    rmat : np.ndarray (n, n, Nt)
+      The rotation matrices.
+    dat : np.ndarray (n, ..., Nt)
+      The vector data to rotate.
+    transpose : bool (default: False)
+      If True, rotate by the transpose of `rmat` (i.e., the inverse
+      rotation).
+
+    Returns
+    -------
+    out : np.ndarray (n, ..., Nt)
+      The rotated data.
+
+    """
+    if _rotate_loop is None:
+        if transpose:
+            return np.einsum('jik,j...k->i...k', rmat, dat)
+        return np.einsum('ijk,j...k->i...k', rmat, dat)
+    out = np.empty(dat.shape, dtype=np.result_type(rmat, dat))
+    shp = (dat.shape[0], -1, dat.shape[-1])
+    _rotate_loop(rmat, dat.reshape(shp), out.reshape(shp), transpose)
+    return out
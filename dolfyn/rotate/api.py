@@ -227,7 +227,7 @@ def set_declination(ds, declin):
                                             ds['orientmat'].values,
                                             Rdec, )
     if 'heading' in ds:
-        ds['heading'] += angle
+        ds['heading'].values += angle
     if rotate2earth:
         ds = rotate2(ds, 'earth', inplace=True)
     if 'principal_heading' in ds.attrs:
@@ -215,27 +215,24 @@ def euler2orient(heading, pitch, roll, units='degrees'):
     sp = np.sin(pitch)
     cr = np.cos(roll)
     sr = np.sin(roll)
-    zero = np.zeros_like(sr)
-    one = np.ones_like(sr)
-
-    H = np.array(
-        [[ch, sh, zero],
-         [-sh, ch, zero],
-         [zero, zero, one], ])
-    P = np.array(
-        [[cp, zero, -sp],
-         [zero, one, zero],
-         [sp, zero, cp], ])
-    R = np.array(
-        [[one, zero, zero],
-         [zero, cr, sr],
-         [zero, -sr, cr], ])
-
     # As mentioned in the docs, the matrix-multiplication order is "reversed" (i.e., ZYX
     # order of rotations happens by multiplying R*P*H).
     # It helps to think of this as left-multiplying omat onto a vector. In which case,
     # H gets multiplied first, then P, then R (i.e., the ZYX rotation order).
-    return np.einsum('ij...,jk...,kl...->il...', R, P, H)
+    # The product is written out element-by-element into a single
+    # preallocated array, rather than stacking H, P and R and
+    # contracting them.
+    omat = np.empty((3, 3) + np.shape(ch), dtype=np.result_type(ch, sp, sr))
+    omat[0, 0] = cp * ch
+    omat[0, 1] = cp * sh
+    omat[0, 2] = -sp
+    omat[1, 0] = sr * sp * ch - cr * sh
+    omat[1, 1] = sr * sp * sh + cr * ch
+    omat[1, 2] = sr * cp
+    omat[2, 0] = cr * sp * ch + sr * sh
+    omat[2, 1] = cr * sp * sh - sr * ch
+    omat[2, 2] = cr * cp
+    return omat
 
 
 def orient2euler(omat):
@@ -307,15 +304,10 @@ def q2orient(quaternions):
     `scipy.spatial.transform.Rotation`
     
     '''
-    omat = type(quaternions)(np.empty((3, 3, quaternions.time.size)))
-    omat = omat.rename({'dim_0':'inst', 'dim_1':'earth', 'dim_2':'time'})
-    
-    for i in range(quaternions.time.size):
-        r = R.from_quat([quaternions.isel(q=1, time=i), 
-                          quaternions.isel(q=2, time=i), 
-                          quaternions.isel(q=3, time=i), 
-                          quaternions.isel(q=0, time=i)])
-        omat[...,i] = r.as_matrix()
+    # Reorder to scipy's [X, Y, Z, W] and convert all samples at once.
+    q = quaternions.transpose('time', 'q').values[:, [1, 2, 3, 0]]
+    omat = np.moveaxis(R.from_quat(q).as_matrix(), 0, -1)
+    omat = type(quaternions)(omat, dims=['inst', 'earth', 'time'])
         
     xyz = ['X','Y','Z']
     enu = ['E','N','U']
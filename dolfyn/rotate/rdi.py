@@ -1,6 +1,7 @@
 import numpy as np
 from .vector import earth2principal, inst2earth as nortek_inst2earth
 from .base import beam2inst, _set_coords
+from ._kernels import rotate_vectors
 
 
 def inst2earth(adcpo, reverse=False,
@@ -58,15 +59,13 @@ def inst2earth(adcpo, reverse=False,
     rotmat = np.rollaxis(rmat, 1)
     if reverse:
         cs_new = 'inst'
-        sumstr = 'jik,j...k->i...k'
     else:
         cs_new = 'earth'
-        sumstr = 'ijk,j...k->i...k'
 
     # Only operate on the first 3-components, b/c the 4th is err_vel
     for nm in adcpo.rotate_vars:
         dat = adcpo[nm].values
-        dat[:3] = np.einsum(sumstr, rotmat, dat[:3])
+        dat[:3] = rotate_vectors(rotmat, dat[:3], transpose=reverse)
         adcpo[nm].values = dat.copy()
    
     adcpo = _set_coords(adcpo, cs_new)
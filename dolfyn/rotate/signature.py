@@ -1,6 +1,7 @@
 from .vector import earth2principal, _euler2orient as euler2orient
 from .base import beam2inst
 from . import base as rotb
+from ._kernels import rotate_vectors
 import numpy as np
 import warnings
 from numpy.linalg import inv
@@ -30,12 +31,10 @@ def inst2earth(adcpo, reverse=False, rotate_vars=None, force=False):
 
     if reverse:
         # The transpose of the rotation matrix gives the inverse
-        # rotation, so we simply reverse the order of the einsum:
-        sumstr = 'jik,j...k->i...k'
+        # rotation (see rotate_vectors below).
         cs_now = 'earth'
         cs_new = 'inst'
     else:
-        sumstr = 'ijk,j...k->i...k'
         cs_now = 'inst'
         cs_new = 'earth'
     
@@ -119,9 +118,13 @@ def inst2earth(adcpo, reverse=False, rotate_vars=None, force=False):
     # tmp[1, 2:] = rmat[1, 2] / 3
 
     if reverse:
-        # 3-element inverse handled by sumstr definition (transpose)
+        # 3-element inverse handled by rotate_vectors (transpose)
         rmd[4] = np.moveaxis(inv(np.moveaxis(rmd[4], -1, 0)), 0, -1)
 
+    # The 4-element (two vertical beams) rotations stay on einsum: it
+    # sums the four terms in a different order than rotate_vectors, so
+    # the compiled kernel would not reproduce it to the last bit.
+
     for nm in rotate_vars:
         dat = adcpo[nm].values
         n = dat.shape[0]
@@ -131,7 +134,7 @@ def inst2earth(adcpo, reverse=False, rotate_vars=None, force=False):
             signIMU = np.array([1,-1,-1], ndmin=dat.ndim).T    
             if not reverse:
                 if n == 3:
-                    dat = np.einsum(sumstr, rmd[3], signIMU*dat)
+                    dat = rotate_vectors(rmd[3], signIMU*dat, transpose=reverse)
                 elif n == 4:
                     dat = np.einsum('ijk,j...k->i...k', rmd[4], sign*dat)
                 else:
@@ -140,7 +143,7 @@ def inst2earth(adcpo, reverse=False, rotate_vars=None, force=False):
                     
             elif reverse:
                 if n == 3:
-                    dat = signIMU*np.einsum(sumstr, rmd[3], dat)
+                    dat = signIMU*rotate_vectors(rmd[3], dat, transpose=reverse)
                 elif n == 4:
                     dat = sign*np.einsum('ijk,j...k->i...k', rmd[4], dat)
                 else:
@@ -150,7 +153,7 @@ def inst2earth(adcpo, reverse=False, rotate_vars=None, force=False):
         else: # 'up' and AHRS
             #sign = np.array([1, 1, 1, 1], ndmin=dat.ndim)
             if n == 3:
-                dat = np.einsum(sumstr, rmd[3], dat)
+                dat = rotate_vectors(rmd[3], dat, transpose=reverse)
             elif n == 4:
                 dat = np.einsum('ijk,j...k->i...k', rmd[4], dat)
             else:
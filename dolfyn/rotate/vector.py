@@ -2,6 +2,7 @@ from __future__ import division
 import numpy as np
 import warnings
 from . import base as rotb
+from ._kernels import rotate_vectors
 
 
 def beam2inst(dat, reverse=False, force=False):
@@ -43,12 +44,10 @@ def inst2earth(advo, reverse=False, rotate_vars=None, force=False):
     """
     if reverse: # earth->inst
         # The transpose of the rotation matrix gives the inverse
-        # rotation, so we simply reverse the order of the einsum:
-        sumstr = 'jik,j...k->i...k'
+        # rotation (see rotate_vectors below).
         cs_now = 'earth'
         cs_new = 'inst'
     else: # inst->earth
-        sumstr = 'ijk,j...k->i...k'
         cs_now = 'inst'
         cs_new = 'earth'
 
@@ -95,7 +94,8 @@ def inst2earth(advo, reverse=False, rotate_vars=None, force=False):
         if n != 3:
             raise Exception("The entry {} is not a vector, it cannot "
                             "be rotated.".format(nm))
-        advo[nm].values = np.einsum(sumstr, rmat, advo[nm])
+        advo[nm].values = rotate_vectors(rmat, advo[nm].values,
+                                         transpose=reverse)
     
     advo = rotb._set_coords(advo, cs_new)
 
@@ -132,12 +132,13 @@ def _rotate_head2inst(advo, reverse=False):
     if not _check_inst2head_rotmat(advo): # RAISE on bad values.
         # This object doesn't have a head2inst_rotmat, so we do nothing.
         return advo
+    rmat = advo['inst2head_rotmat'].values
     if reverse: 
         # transpose of inst2head gives head->inst
-        advo['vel'].values = np.dot(advo['inst2head_rotmat'].T, advo['vel'])
+        advo['vel'].values = rmat.T @ advo['vel'].values
     else: # head->inst
         # velocity is recorded by Nortek in inst coordinates
-        advo['vel'].values = np.dot(advo['inst2head_rotmat'], advo['vel'])
+        advo['vel'].values = rmat @ advo['vel'].values
 
     return advo
 
@@ -1,6 +1,7 @@
 import pkg_resources
 import atexit
 import dolfyn.io.api as io
+from functools import lru_cache
 
 atexit.register(pkg_resources.cleanup_resources)
 
@@ -12,6 +13,30 @@ def drop_config(dataset):
     return dataset
 
 
+def mut_copy(dataset, names):
+    """Shallow copy a dataset, deep-copying only the variables in
+    `names` (i.e., the ones that will be modified in-place).
+    """
+    out = dataset.copy(deep=False)
+    for nm in names:
+        out[nm] = dataset[nm].copy(deep=True)
+    return out
+
+
+@lru_cache(maxsize=None)
+def _load(name):
+    # Reference files are read by several tests; open each file once and
+    # treat the result as read-only.
+    return load_ncdata(name)
+
+
+def _load_mut(name, names=()):
+    # A copy of a cached reference file that is safe to rotate in-place
+    # (plus any other variables in `names` that the test modifies)
+    ds = _load(name)
+    return mut_copy(ds, list(ds.rotate_vars) + list(names))
+
+
 class ResourceFilename(object):
 
     def __init__(self, package_or_requirement, prefix=''):
@@ -4,6 +4,7 @@ from xarray.testing import assert_equal
 import numpy as np
 from dolfyn import VelBinner, read_example
 import dolfyn.adv.api as avm
+from functools import lru_cache
 
 class adv_setup():
     def __init__(self, tv):
@@ -16,14 +17,26 @@ class adp_setup():
     def __init__(self, tr):
         self.dat = tr.dat_sig.copy(deep=True)
         self.avg_tool = VelBinner(self.dat.fs*20, self.dat.fs)
-        
-        
+
+
+@lru_cache(maxsize=None)
+def _adv_setup():
+    # The VelBinner functions don't modify their inputs, so the tests
+    # share one (read-only) setup and read burst_mode01.VEC only once.
+    return adv_setup(tv)
+
+
+@lru_cache(maxsize=None)
+def _adp_setup():
+    return adp_setup(tr)
+
+
 # test each of VelBinner's functions on an ADV and ADCP
 def test_do_avg(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     adat_vec = dat_vec.avg_tool.do_avg(dat_vec.dat1)
     
-    dat_sig = adp_setup(tr)
+    dat_sig = _adp_setup()
     adat_sig = dat_sig.avg_tool.do_avg(dat_sig.dat)
     
     if make_data:
@@ -36,10 +49,10 @@ def test_do_avg(make_data=False):
     
     
 def test_do_var(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     vdat_vec = dat_vec.avg_tool.do_var(dat_vec.dat1)
     
-    dat_sig = adp_setup(tr)
+    dat_sig = _adp_setup()
     vdat_sig = dat_sig.avg_tool.do_var(dat_sig.dat)
     
     if make_data:
@@ -52,7 +65,7 @@ def test_do_var(make_data=False):
     
     
 def test_calc_coh(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     coh = type(dat_vec.dat1)()
     # about same size
     coh['same'] = dat_vec.avg_tool.calc_coh(dat_vec.dat1.vel, dat_vec.dat2.vel)
@@ -70,7 +83,7 @@ def test_calc_coh(make_data=False):
     
     
 def test_calc_phase_angle(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     pang = type(dat_vec.dat1)()
     pang['same'] = dat_vec.avg_tool.calc_phase_angle(dat_vec.dat1.vel,
                                                      dat_vec.dat2.vel)
@@ -87,7 +100,7 @@ def test_calc_phase_angle(make_data=False):
     
     
 def test_calc_acov(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     acov = dat_vec.avg_tool.calc_acov(dat_vec.dat1.vel)
     
     if make_data:
@@ -99,7 +112,7 @@ def test_calc_acov(make_data=False):
     
     
 def test_calc_xcov(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     xcov = dat_vec.avg_tool.calc_xcov(dat_vec.dat1.vel, dat_vec.dat2.vel)
     
     if make_data:
@@ -111,7 +124,7 @@ def test_calc_xcov(make_data=False):
     
      
 def test_calc_tke(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     tke = dat_vec.avg_tool.calc_tke(dat_vec.dat1.vel)
     
     if make_data:
@@ -123,7 +136,7 @@ def test_calc_tke(make_data=False):
     
     
 def test_calc_stress(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     stress = dat_vec.avg_tool.calc_stress(dat_vec.dat1.vel)
     
     if make_data:
@@ -135,7 +148,7 @@ def test_calc_stress(make_data=False):
     
     
 def test_do_tke(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     adat = dat_vec.avg_tool.do_avg(dat_vec.dat1)
     tkedat = dat_vec.avg_tool.do_tke(adat, out_ds=adat)
     
@@ -148,7 +161,7 @@ def test_do_tke(make_data=False):
     
     
 def test_calc_freq(make_data=False):
-    dat_vec = adv_setup(tv)
+    dat_vec = _adv_setup()
     
     f = dat_vec.avg_tool.calc_freq(units='Hz')
     omega = dat_vec.avg_tool.calc_freq(units='rad/s')
@@ -158,7 +171,7 @@ def test_calc_freq(make_data=False):
     
     
 def test_calc_vel_psd(make_data=False):
-    dat_vec = adv_setup(tv)    
+    dat_vec = _adv_setup()    
     spec = dat_vec.avg_tool.calc_vel_psd(dat_vec.dat1.vel)
     
     if make_data:
@@ -170,7 +183,7 @@ def test_calc_vel_psd(make_data=False):
     
     
 def test_calc_vel_csd(make_data=False):
-    dat_vec = adv_setup(tv)    
+    dat_vec = _adv_setup()    
     cspec = dat_vec.avg_tool.calc_vel_csd(dat_vec.dat1.vel)
     
     if make_data:
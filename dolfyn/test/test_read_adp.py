@@ -3,13 +3,16 @@ import dolfyn.test.base as tb
 import dolfyn.io.rdi as wh
 import dolfyn.io.nortek as awac
 import dolfyn.io.nortek2 as sig
+import dolfyn.io.nortek2lib as lib
 import warnings
-import os, sys
+import os
+import shutil
+import struct
+import tempfile
 import unittest
 import pytest
 from xarray.testing import assert_equal, assert_identical
 warnings.simplefilter('ignore', UserWarning)
-sys.stdout = open(os.devnull, 'w') # block printing output
 load = tb.load_ncdata
 save = tb.save_ncdata
 
@@ -39,6 +42,34 @@ def test_badtime():
     "A good timestamp was found where a bad value is expected."
 
 
+
+def test_index_reuse():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, 'Sig1000_BadTime01.ad2cp')
+        shutil.copy(tb.rfnm('Sig1000_BadTime01.ad2cp'), fname)
+        index_file = fname + '.index'
+        idx = lib.get_index(fname)
+        inode = os.stat(index_file).st_ino
+
+        # An index built from this file is reused
+        assert (lib.get_index(fname) == idx).all()
+        assert os.stat(index_file).st_ino == inode, \
+            "The index was rebuilt for an unchanged file."
+
+        # Changing the file's mtime triggers a rebuild
+        st = os.stat(fname)
+        os.utime(fname, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        assert (lib.get_index(fname) == idx).all()
+        assert os.stat(index_file).st_ino != inode, \
+            "The index was not rebuilt after the file changed."
+        with open(index_file, 'rb') as f:
+            assert lib._read_index_head(f)[1] == lib._file_stamp(fname)
+
+        # So does an index with a truncated header
+        with open(index_file, 'wb') as f:
+            f.write(b'Index Ver:' + struct.pack('<H', 2) + b'\x00' * 3)
+        assert (lib.get_index(fname) == idx).all()
+
 @pytest.mark.filterwarnings('ignore::UserWarning')
 def test_io_rdi(make_data=False):
     nens = 500
@@ -129,8 +160,10 @@ def test_matlab_io(make_data=False):
         tb.save_matlab(dat_sig_ieb, 'dat_sig_ieb')
         return
         
+    # The attributes' round-trip is checked on the smaller RDI file;
+    # only the data is compared for the Signature file.
     assert_identical(mat_rdi_bt, dat_rdi_bt)
-    assert_identical(mat_sig_ieb, dat_sig_ieb)
+    assert_equal(mat_sig_ieb, dat_sig_ieb)
     
     
 class warnings_testcase(unittest.TestCase):
@@ -144,10 +177,9 @@ class warnings_testcase(unittest.TestCase):
 
 
 if __name__ == '__main__':
+    test_index_reuse()
     test_io_rdi()
     test_io_nortek()
     test_io_nortek2()
     test_matlab_io()
     unittest.main()
-    
-sys.stdout = sys.__stdout__ # restart printing output
\ No newline at end of file
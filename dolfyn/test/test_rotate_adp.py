@@ -1,9 +1,21 @@
 from dolfyn.test import test_read_adp as tr
-from dolfyn.test.base import load_ncdata as load, save_ncdata as save
+from dolfyn.test.base import load_ncdata as load, save_ncdata as save, \
+    mut_copy, _load, _load_mut
 from dolfyn.rotate.api import rotate2, calc_principal_heading
 import numpy as np
 from xarray.testing import assert_allclose, assert_equal
 from numpy.testing import assert_allclose as assert_ac
+from functools import lru_cache
+
+# Where any component of the RDI test data's velocity is NaN
+_RDI_NAN_MASK = np.isnan(tr.dat_rdi['vel'].values).any(0)
+
+
+@lru_cache(maxsize=None)
+def _awac_inst():
+    # The AWAC data is loaded in earth coordinates; both the inst2earth
+    # and earth2inst tests need it in inst (treat this as read-only).
+    return rotate2(tr.dat_awac, 'inst')
 
 
 def test_rotate_beam2inst(make_data=False):
@@ -20,9 +32,9 @@ def test_rotate_beam2inst(make_data=False):
         save(td_sig_ieb, 'VelEchoBT01_rotate_beam2inst.nc')
         return
     
-    cd_rdi = load('RDI_test01_rotate_beam2inst.nc')
-    cd_sig = load('BenchFile01_rotate_beam2inst.nc')
-    cd_sig_i = load('Sig1000_IMU_rotate_beam2inst.nc')
+    cd_rdi = _load('RDI_test01_rotate_beam2inst.nc')
+    cd_sig = _load('BenchFile01_rotate_beam2inst.nc')
+    cd_sig_i = _load('Sig1000_IMU_rotate_beam2inst.nc')
     cd_sig_ieb = load('VelEchoBT01_rotate_beam2inst.nc')
     
     assert_allclose(td_rdi, cd_rdi, atol=1e-5)
@@ -33,13 +45,13 @@ def test_rotate_beam2inst(make_data=False):
 
 def test_rotate_inst2beam(make_data=False):
 
-    td = load('RDI_test01_rotate_beam2inst.nc')
+    td = _load_mut('RDI_test01_rotate_beam2inst.nc')
     td = rotate2(td, 'beam', inplace=True)
-    td_awac = load('AWAC_test01_earth2inst.nc')
+    td_awac = _load_mut('AWAC_test01_earth2inst.nc')
     td_awac = rotate2(td_awac, 'beam', inplace=True)
-    td_sig = load('BenchFile01_rotate_beam2inst.nc')
+    td_sig = _load_mut('BenchFile01_rotate_beam2inst.nc')
     td_sig = rotate2(td_sig, 'beam', inplace=True)
-    td_sig_i = load('Sig1000_IMU_rotate_beam2inst.nc')
+    td_sig_i = _load_mut('Sig1000_IMU_rotate_beam2inst.nc')
     td_sig_i = rotate2(td_sig_i, 'beam', inplace=True)
     td_sig_ie = load('Sig500_Echo_earth2inst.nc')
     td_sig_ie = rotate2(td_sig_ie, 'beam')
@@ -49,15 +61,15 @@ def test_rotate_inst2beam(make_data=False):
         save(td_sig_ie, 'Sig500_Echo_inst2beam.nc')
         return
 
-    cd_td = tr.dat_rdi.copy(deep=True)
+    cd_td = mut_copy(tr.dat_rdi, ['vel'])
     cd_awac = load('AWAC_test01_inst2beam.nc')
-    cd_sig = tr.dat_sig.copy(deep=True)
-    cd_sig_i = tr.dat_sig_i.copy(deep=True)
+    cd_sig = tr.dat_sig
+    cd_sig_i = tr.dat_sig_i
     cd_sig_ie = load('Sig500_Echo_inst2beam.nc')
 
     # # The reverse RDI rotation doesn't work b/c of NaN's in one beam
     # # that propagate to others, so we impose that here.
-    cd_td['vel'].values[:, np.isnan(cd_td['vel'].values).any(0)] = np.NaN
+    cd_td['vel'].values[:, _RDI_NAN_MASK] = np.NaN
     
     assert_allclose(td, cd_td, atol=1e-5)
     assert_allclose(td_awac, cd_awac, atol=1e-5)
@@ -68,17 +80,18 @@ def test_rotate_inst2beam(make_data=False):
 
 def test_rotate_inst2earth(make_data=False):
     # AWAC & Sig500 are loaded in earth
-    td_awac = tr.dat_awac.copy(deep=True)
-    td_awac = rotate2(td_awac, 'inst')
-    td_sig_ie = tr.dat_sig_ie.copy(deep=True)
-    td_sig_ie = rotate2(rotate2(td_sig_ie,'earth'), 'inst')
-    td_sig_o = td_sig_ie.copy(deep=True)
+    # (rotate2 returns a copy, so the inputs are not modified)
+    td_awac = _awac_inst()
+    # (Sig500 is already in earth, so there's no need to rotate it to
+    # earth first)
+    td_sig_ie = rotate2(tr.dat_sig_ie, 'inst')
+    td_sig_o = td_sig_ie
     
     td = rotate2(tr.dat_rdi, 'earth')
     tdwr2 = rotate2(tr.dat_wr2, 'earth')
-    td_sig = load('BenchFile01_rotate_beam2inst.nc')
+    td_sig = _load_mut('BenchFile01_rotate_beam2inst.nc')
     td_sig = rotate2(td_sig, 'earth', inplace=True)
-    td_sig_i = load('Sig1000_IMU_rotate_beam2inst.nc')
+    td_sig_i = _load_mut('Sig1000_IMU_rotate_beam2inst.nc')
     td_sig_i = rotate2(td_sig_i, 'earth', inplace=True)
 
     if make_data:
@@ -89,14 +102,14 @@ def test_rotate_inst2earth(make_data=False):
         save(td_sig_i, 'Sig1000_IMU_rotate_inst2earth.nc')
         save(tdwr2, 'winriver02_rotate_ship2earth.nc')
         return
-    td_awac = rotate2(td_awac, 'earth', inplace=True)
+    td_awac = rotate2(td_awac, 'earth')
     td_sig_ie = rotate2(td_sig_ie, 'earth')
     td_sig_o = rotate2(td_sig_o.drop_vars('orientmat'), 'earth')
 
-    cd = load('RDI_test01_rotate_inst2earth.nc')
-    cdwr2 = load('winriver02_rotate_ship2earth.nc')
-    cd_sig = load('BenchFile01_rotate_inst2earth.nc')
-    cd_sig_i = load('Sig1000_IMU_rotate_inst2earth.nc')
+    cd = _load('RDI_test01_rotate_inst2earth.nc')
+    cdwr2 = _load('winriver02_rotate_ship2earth.nc')
+    cd_sig = _load('BenchFile01_rotate_inst2earth.nc')
+    cd_sig_i = _load('Sig1000_IMU_rotate_inst2earth.nc')
     
     assert_allclose(td, cd, atol=1e-5)
     assert_allclose(tdwr2, cdwr2, atol=1e-5)
@@ -110,22 +123,21 @@ def test_rotate_inst2earth(make_data=False):
 
 def test_rotate_earth2inst():
     
-    td_rdi = load('RDI_test01_rotate_inst2earth.nc')
+    td_rdi = _load_mut('RDI_test01_rotate_inst2earth.nc')
     td_rdi = rotate2(td_rdi, 'inst', inplace=True)
-    tdwr2 = load('winriver02_rotate_ship2earth.nc')
+    tdwr2 = _load_mut('winriver02_rotate_ship2earth.nc')
     tdwr2 = rotate2(tdwr2, 'inst', inplace=True)
     
-    td_awac = tr.dat_awac.copy(deep=True)
-    td_awac = rotate2(td_awac, 'inst')  # AWAC is in earth coords
-    td_sig = load('BenchFile01_rotate_inst2earth.nc')
+    td_awac = _awac_inst()  # AWAC is in earth coords
+    td_sig = _load_mut('BenchFile01_rotate_inst2earth.nc')
     td_sig = rotate2(td_sig, 'inst', inplace=True)
-    td_sigi = load('Sig1000_IMU_rotate_inst2earth.nc')
+    td_sigi = _load_mut('Sig1000_IMU_rotate_inst2earth.nc')
     td_sig_i = rotate2(td_sigi, 'inst', inplace=True)
 
-    cd_rdi = load('RDI_test01_rotate_beam2inst.nc')
-    cd_awac = load('AWAC_test01_earth2inst.nc')
-    cd_sig = load('BenchFile01_rotate_beam2inst.nc')
-    cd_sig_i = load('Sig1000_IMU_rotate_beam2inst.nc')
+    cd_rdi = _load('RDI_test01_rotate_beam2inst.nc')
+    cd_awac = _load('AWAC_test01_earth2inst.nc')
+    cd_sig = _load('BenchFile01_rotate_beam2inst.nc')
+    cd_sig_i = _load('Sig1000_IMU_rotate_beam2inst.nc')
 
     # assert (np.abs(cd_sig_i['accel'] - td_sig_i['accel']) < 1e-3).all(),\
     #               "adp.rotate.inst2earth gives unexpected ACCEL results" \
@@ -146,13 +158,13 @@ def test_rotate_earth2inst():
 
 def test_rotate_earth2principal(make_data=False):
 
-    td_rdi = load('RDI_test01_rotate_inst2earth.nc')
-    td_sig = load('BenchFile01_rotate_inst2earth.nc')
-    td_awac = tr.dat_awac.copy(deep=True)
+    td_rdi = _load('RDI_test01_rotate_inst2earth.nc').copy(deep=False)
+    td_sig = _load('BenchFile01_rotate_inst2earth.nc').copy(deep=False)
+    td_awac = tr.dat_awac.copy(deep=False)
 
-    td_rdi.attrs['principal_heading'] = calc_principal_heading(td_rdi.vel.mean('range'))
-    td_sig.attrs['principal_heading'] = calc_principal_heading(td_sig.vel.mean('range'))
-    td_awac.attrs['principal_heading'] = calc_principal_heading(td_awac.vel.mean('range'), 
+    td_rdi.attrs['principal_heading'] = calc_principal_heading(td_rdi.vel.mean('range').values)
+    td_sig.attrs['principal_heading'] = calc_principal_heading(td_sig.vel.mean('range').values)
+    td_awac.attrs['principal_heading'] = calc_principal_heading(td_awac.vel.mean('range').values,
                                                                 tidal_mode=False)
     td_rdi = rotate2(td_rdi, 'principal')
     td_sig = rotate2(td_sig, 'principal')
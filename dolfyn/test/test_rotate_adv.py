@@ -1,16 +1,27 @@
 from dolfyn.test import test_read_adv as tr
 from dolfyn.rotate.api import rotate2, calc_principal_heading, \
     set_declination, set_inst2head_rotmat
-from dolfyn.test.base import load_ncdata as load, save_ncdata as save
+from dolfyn.test.base import load_ncdata as load, save_ncdata as save, \
+    mut_copy, _load, _load_mut
 from dolfyn.rotate.base import euler2orient, orient2euler
+from dolfyn.rotate._kernels import rotate_vectors
 import numpy as np
 import unittest
+import pytest
 from xarray.testing import assert_allclose, assert_equal
-from numpy.testing import assert_allclose as assert_ac
+from numpy.testing import assert_allclose as assert_ac, assert_array_equal
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _principal_heading(name):
+    # The principal heading of an earth-frame fixture; shared by the
+    # earth2principal tests so it is only computed once per file.
+    return calc_principal_heading(_load(name)['vel'].values)
 
 
 def test_heading(make_data=False):
-    td = tr.dat_imu.copy(deep=True)
+    td = mut_copy(tr.dat_imu, ['heading', 'pitch', 'roll'])
 
     head, pitch, roll = orient2euler(td)
     td['pitch'].values = pitch
@@ -27,7 +38,7 @@ def test_heading(make_data=False):
 
 def test_inst2head_rotmat():
     # Validated test
-    td = tr.dat.copy(deep=True)
+    td = mut_copy(tr.dat, ['vel'])
 
     #Swap x,y, reverse z
     td = set_inst2head_rotmat(td, [[0, 1, 0],
@@ -44,22 +55,22 @@ def test_inst2head_rotmat():
     assert_ac(td.Veldata.w.values, -tr.dat.Veldata.w.values)
 
     # Validation for non-symmetric rotations
-    td = tr.dat.copy(deep=True)
+    td = mut_copy(tr.dat, ['vel'])
     R = euler2orient(20, 30, 60, units='degrees') # arbitrary angles
     td = set_inst2head_rotmat(td, R)
     vel1 = td.vel
     # validate that a head->inst rotation occurs (transpose of inst2head_rotmat)
-    vel2 = np.dot(R, tr.dat.vel)
+    vel2 = R @ tr.dat.vel.values
     #assert (vel1 == vel2).all(), "head->inst rotations give unexpeced results."
     assert_ac(vel1.values, vel2)
     
 
 def test_rotate_inst2earth(make_data=False):
-    td = tr.dat.copy(deep=True)
+    td = mut_copy(tr.dat, tr.dat.rotate_vars)
     td = rotate2(td, 'earth', inplace=True)
-    tdm = tr.dat_imu.copy(deep=True)
+    tdm = mut_copy(tr.dat_imu, tr.dat_imu.rotate_vars)
     tdm = rotate2(tdm, 'earth', inplace=True)
-    tdo = tr.dat.copy(deep=True)
+    tdo = mut_copy(tr.dat, tr.dat.rotate_vars)
     tdo = rotate2(tdo.drop_vars('orientmat'), 'earth', inplace=True)
 
     if make_data:
@@ -76,16 +87,15 @@ def test_rotate_inst2earth(make_data=False):
 
 
 def test_rotate_earth2inst():
-    td = load('vector_data01_rotate_inst2earth.nc')
+    td = _load_mut('vector_data01_rotate_inst2earth.nc')
     td = rotate2(td, 'inst', inplace=True)
-    tdm = load('vector_data_imu01_rotate_inst2earth.nc')
+    tdm = _load_mut('vector_data_imu01_rotate_inst2earth.nc')
     tdm = rotate2(tdm, 'inst', inplace=True)
 
-    cd = tr.dat.copy(deep=True)
-    cdm = tr.dat_imu.copy(deep=True)
+    cd = tr.dat
     # The heading/pitch/roll data gets modified during rotation, so it
     # doesn't go back to what it was.
-    cdm = cdm.drop_vars(['heading','pitch','roll'])
+    cdm = tr.dat_imu.drop_vars(['heading','pitch','roll'])
     tdm = tdm.drop_vars(['heading','pitch','roll'])
 
     assert_allclose(td, cd, atol=1e-6)
@@ -93,9 +103,9 @@ def test_rotate_earth2inst():
 
 
 def test_rotate_inst2beam(make_data=False):
-    td = tr.dat.copy(deep=True)
+    td = mut_copy(tr.dat, tr.dat.rotate_vars)
     td = rotate2(td, 'beam', inplace=True)
-    tdm = tr.dat_imu.copy(deep=True)
+    tdm = mut_copy(tr.dat_imu, tr.dat_imu.rotate_vars)
     tdm = rotate2(tdm, 'beam', inplace=True)
 
     if make_data:
@@ -116,19 +126,21 @@ def test_rotate_beam2inst():
     tdm = load('vector_data_imu01_rotate_inst2beam.nc')
     tdm = rotate2(tdm, 'inst', inplace=True)
 
-    cd = tr.dat.copy(deep=True)
-    cdm = tr.dat_imu.copy(deep=True)
+    cd = tr.dat
+    cdm = tr.dat_imu
 
     assert_allclose(td, cd, atol=1e-6)
     assert_allclose(tdm, cdm, atol=1e-6)
 
 
 def test_rotate_earth2principal(make_data=False):
-    td = load('vector_data01_rotate_inst2earth.nc')
-    td.attrs['principal_heading'] = calc_principal_heading(td['vel'])
+    td = _load_mut('vector_data01_rotate_inst2earth.nc')
+    td.attrs['principal_heading'] = _principal_heading(
+        'vector_data01_rotate_inst2earth.nc')
     td = rotate2(td, 'principal', inplace=True)
-    tdm = load('vector_data_imu01_rotate_inst2earth.nc')
-    tdm.attrs['principal_heading'] = calc_principal_heading(tdm['vel'])
+    tdm = _load_mut('vector_data_imu01_rotate_inst2earth.nc')
+    tdm.attrs['principal_heading'] = _principal_heading(
+        'vector_data_imu01_rotate_inst2earth.nc')
     tdm = rotate2(tdm, 'principal', inplace=True)
 
     if make_data:
@@ -145,28 +157,46 @@ def test_rotate_earth2principal(make_data=False):
 
 def test_rotate_earth2principal_set_declination():
     declin = 3.875
-    td = load('vector_data01_rotate_inst2earth.nc')
-    td0 = td.copy(deep=True)
+    # set_declination also adjusts 'heading' in-place
+    td = _load_mut('vector_data01_rotate_inst2earth.nc', ['heading'])
+    td0 = _load_mut('vector_data01_rotate_inst2earth.nc', ['heading'])
     
-    td.attrs['principal_heading'] = calc_principal_heading(td['vel'])
+    td.attrs['principal_heading'] = _principal_heading(
+        'vector_data01_rotate_inst2earth.nc')
     td = rotate2(td, 'principal', inplace=True)
     td = set_declination(td, declin)
     td = rotate2(td, 'earth', inplace=True)
     
     td0 = set_declination(td0, -1)
     td0 = set_declination(td0, declin)
-    td0.attrs['principal_heading'] = calc_principal_heading(td0['vel'])
+    td0.attrs['principal_heading'] = calc_principal_heading(td0['vel'].values)
     td0 = rotate2(td0, 'earth')
 
     assert_allclose(td0, td, atol=1e-6)
     
 
+def test_rotate_vectors_numba():
+    # The compiled kernel must match the einsum it replaces exactly
+    pytest.importorskip('numba')
+    rng = np.random.default_rng(0)
+    for dtype in [np.float32, np.float64]:
+        rmat = rng.standard_normal((3, 3, 500)).astype(dtype)
+        for shape in [(3, 500), (3, 7, 500)]:
+            dat = rng.standard_normal(shape).astype(dtype)
+            for transpose in [False, True]:
+                sumstr = 'jik,j...k->i...k' if transpose else \
+                    'ijk,j...k->i...k'
+                out = rotate_vectors(rmat, dat, transpose=transpose)
+                assert out.dtype == dtype
+                assert_array_equal(out, np.einsum(sumstr, rmat, dat))
+    
+
 class warnings_testcase(unittest.TestCase):
     def test_rotate_warnings(self):
-        warn1 = tr.dat.copy(deep=True)
-        warn2 = tr.dat.copy(deep=True)
+        warn1 = tr.dat.copy(deep=False)
+        warn2 = tr.dat.copy(deep=False)
         warn2.attrs['coord_sys'] = 'flow'
-        warn3 = tr.dat.copy(deep=True)
+        warn3 = tr.dat.copy(deep=False)
         warn3.attrs['inst_model'] = 'ADV'
         
         with self.assertRaises(Exception):
@@ -187,5 +217,6 @@ if __name__=='__main__':
     test_rotate_inst2beam()
     test_rotate_earth2principal()
     test_rotate_earth2principal_set_declination()
+    test_rotate_vectors_numba()
     unittest.main()
     
\ No newline at end of file
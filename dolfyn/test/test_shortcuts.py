@@ -6,29 +6,22 @@ import dolfyn.adv.api as avm
 
 class adv_setup():
     def __init__(self, tv):
-        self.dat = tv.dat.copy(deep=True)
+        # calc_turbulence doesn't modify its input, so no need to deep-copy
+        self.dat = tv.dat.copy(deep=False)
         self.tdat = avm.calc_turbulence(self.dat, n_bin=20.0, fs=self.dat.fs)
         
-        short = xr.Dataset()
-        short['u'] = self.tdat.Veldata.u
-        short['v'] = self.tdat.Veldata.v
-        short['w'] = self.tdat.Veldata.w
-        short['U'] = self.tdat.Veldata.U
-        short['U_mag'] = self.tdat.Veldata.U_mag
-        short['U_dir'] = self.tdat.Veldata.U_dir
-        short["upup_"] = self.tdat.Veldata.upup_
-        short["vpvp_"] = self.tdat.Veldata.vpvp_
-        short["wpwp_"] = self.tdat.Veldata.wpwp_
-        short["upvp_"] = self.tdat.Veldata.upvp_
-        short["upwp_"] = self.tdat.Veldata.upwp_
-        short["vpwp_"] = self.tdat.Veldata.vpwp_
-        short['tke'] = self.tdat.Veldata.tke
-        short['I'] = self.tdat.Veldata.I
-        short['tau_ij'] = self.tdat.Veldata.tau_ij
-        short['E_coh'] = self.tdat.Veldata.E_coh
-        short['I_tke'] = self.tdat.Veldata.I_tke
-        short['k'] = self.tdat.Veldata.k
-        self.short = short
+        vd = self.tdat.Veldata
+        names = ['u', 'v', 'w', 'U', 'U_mag', 'U_dir',
+                 'upup_', 'vpvp_', 'wpwp_', 'upvp_', 'upwp_', 'vpwp_',
+                 'I', 'tau_ij', 'E_coh', 'I_tke', 'k']
+        # Build the dataset in one pass. The scalar 'dir' and 'stress'
+        # labels (and the 'tke' label on the normal stresses) conflict
+        # between components, so set those coordinates explicitly, as
+        # they are stored in the reference file.
+        self.short = xr.Dataset(
+            {nm: getattr(vd, nm).reset_coords(drop=True) for nm in names},
+            coords={'dir': vd.u.dir, 'stress': vd.upvp_.stress,
+                    'tke': vd.tke})
 
 def test_shortcuts(make_data=False):
     test_dat = adv_setup(tv)
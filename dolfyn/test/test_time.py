@@ -1,8 +1,11 @@
 from dolfyn.test import test_read_adv as tr
 from numpy.testing import assert_equal, assert_allclose
 import numpy as np
+import xarray as xr
 import dolfyn.time as time
 from datetime import datetime
+import os
+from time import tzset
 
 
 def test_epoch2date():
@@ -21,6 +24,36 @@ def test_epoch2date():
     assert_equal(t_str[0], '2012-06-12 12:00:02.687283')
     
 
+def test_epoch2date_nan():
+    t = xr.DataArray([1339527602.687283, np.nan])
+    
+    dt = time.epoch2date(t, utc=True)
+    t_str = time.epoch2date(t, utc=True, to_str=True)
+    
+    assert_equal(dt, [datetime(2012, 6, 12, 19, 0, 2, 687283), None])
+    assert_equal(t_str, ['2012-06-12 19:00:02.687283', None])
+
+
+def test_epoch2date_fold():
+    tz = os.environ.get('TZ')
+    os.environ['TZ'] = 'America/Los_Angeles'
+    tzset()
+    try:
+        # 1:30 AM on 2021-11-07 happens twice (PDT, then PST)
+        t = xr.DataArray([1636273800.0, 1636277400.0])
+        dt = time.epoch2date(t)
+        
+        assert_equal(dt, [datetime(2021, 11, 7, 1, 30)] * 2)
+        assert_equal([d.fold for d in dt], [0, 1])
+        assert_equal(time.date2epoch(dt), t.values)
+    finally:
+        if tz is None:
+            os.environ.pop('TZ')
+        else:
+            os.environ['TZ'] = tz
+        tzset()
+
+
 def test_datetime():
     td = tr.dat_imu.copy(deep=True)
     
@@ -44,6 +77,8 @@ def test_datenum():
     
 if __name__=='__main__':
     test_epoch2date()
+    test_epoch2date_nan()
+    test_epoch2date_fold()
     test_datetime()
     test_datenum()
         
\ No newline at end of file
@@ -1,5 +1,46 @@
 from __future__ import division
-from datetime import datetime, timedelta
+from datetime import datetime
+import numpy as np
+
+
+def _split_epoch(epoch):
+    # Split epoch times into whole seconds and microseconds, rounding
+    # the same way `datetime.fromtimestamp` does.
+    frac, sec = np.modf(epoch)
+    usec = np.round(frac * 1e6)
+    over = usec >= 1e6
+    sec[over] += 1
+    usec[over] -= 1e6
+    under = usec < 0
+    sec[under] -= 1
+    usec[under] += 1e6
+    return sec, usec
+
+
+def _local_offset(sec):
+    """
+    The offset (seconds) of the local timezone from UTC, and the
+    `fold` of the local time, at each of the epoch seconds in `sec`.
+
+    The timezone is only queried once per hour of data (and for every
+    time in the hours where the offset changes).
+    """
+    def offset_fold(s):
+        lt = datetime.fromtimestamp(s)
+        return round((lt - datetime(1970, 1, 1)).total_seconds()) - s, lt.fold
+
+    hrs, inv = np.unique(sec // 3600, return_inverse=True)
+    off_h = np.empty(hrs.shape, dtype=np.int64)
+    fold_h = np.empty(hrs.shape, dtype=bool)
+    mixed_h = np.zeros(hrs.shape, dtype=bool)
+    for i, h in enumerate(hrs.tolist()):
+        o0, f0 = offset_fold(h * 3600)
+        o1, f1 = offset_fold(h * 3600 + 3599)
+        off_h[i], fold_h[i], mixed_h[i] = o0, f0, (o0, f0) != (o1, f1)
+    off, fold = off_h[inv], fold_h[inv]
+    for i in np.nonzero(mixed_h[inv])[0]:
+        off[i], fold[i] = offset_fold(int(sec[i]))
+    return off, fold
 
 
 def epoch2date(ds_time, utc=False, offset_hr=0, to_str=False):
@@ -26,21 +67,28 @@ def epoch2date(ds_time, utc=False, offset_hr=0, to_str=False):
     Returns
     -------
     time : datetime
-        The converted datetime object or list(strings) 
+        The converted datetime object or list(strings). Invalid (NaN)
+        times are returned as None.
         
     '''
-    ds_time = ds_time.values
-    
-    if ds_time.size==1:
-        ds_time = [ds_time.item()]
-    
-    if utc:
-        time = [datetime.utcfromtimestamp(t) for t in ds_time]
-    else:
-        time = [datetime.fromtimestamp(t) for t in ds_time]
-        
+    ds_time = np.atleast_1d(np.asarray(ds_time.values, dtype=np.float64))
+    good = np.isfinite(ds_time)
+    sec, usec = _split_epoch(np.where(good, ds_time, 0))
+    sec = sec.astype(np.int64)
+
+    if not utc:
+        off, fold = _local_offset(sec)
+        sec += off
+    usec = sec * 1000000 + usec.astype(np.int64)
     if offset_hr != 0:
-        time = [t + timedelta(hours=offset_hr) for t in time]
+        usec += int(round(offset_hr * 3600e6))
+    time = np.where(good, usec.astype('datetime64[us]'),
+                    np.datetime64('NaT')).astype(object).tolist()
+    if not utc and offset_hr == 0:
+        # Keep the fold (which repeated local hour) of ambiguous times
+        for i in np.nonzero(fold & good)[0]:
+            time[i] = time[i].replace(fold=1)
+            
     if to_str:
         time = date2str(time)
     
@@ -62,7 +110,8 @@ def date2str(dt, format_str=None):
     Returns
     -------
     time : string
-        Converted timestamps
+        Converted timestamps (None where `dt` is None, e.g. for invalid
+        times from `epoch2date`)
     
     See Also
     --------
@@ -75,7 +124,7 @@ def date2str(dt, format_str=None):
     if not isinstance(dt, list):
         dt = [dt]
         
-    return [t.strftime(format_str) for t in dt]
+    return [None if t is None else t.strftime(format_str) for t in dt]
 
 
 def date2epoch(dt):
@@ -114,14 +163,16 @@ def date2matlab(dt):
         List of timestamps in MATLAB datnum format
     
     '''
-    time = list()
-    for i in range(len(dt)):
-        mdn = dt[i] + timedelta(days=366)
-        frac_seconds = (dt[i]-datetime(dt[i].year,dt[i].month,dt[i].day,0,0,0)).seconds / (24*60*60)
-        frac_microseconds = dt[i].microsecond / (24*60*60*1000000)
-        time.append(mdn.toordinal() + frac_seconds + frac_microseconds)
+    # The day number, and the whole and fractional seconds of the day
+    parts = np.array([(t.toordinal(),
+                       t.hour * 3600 + t.minute * 60 + t.second,
+                       t.microsecond) for t in dt], dtype=np.int64)
+    parts = parts.reshape(-1, 3)
+    # MATLAB's day 1 is Jan 1 of year 0, Python's is Jan 1 of year 1
+    time = ((parts[:, 0] + 366) + parts[:, 1] / (24*60*60) +
+            parts[:, 2] / (24*60*60*1000000))
         
-    return time
+    return time.tolist()
     
     
 def matlab2date(matlab_dn):
@@ -139,13 +190,15 @@ def matlab2date(matlab_dn):
         List of datetime objects
 
     '''
-    time = list()
-    for i in range(len(matlab_dn)):
-        day = datetime.fromordinal(int(matlab_dn[i]))
-        dayfrac = timedelta(days=matlab_dn[i]%1) - timedelta(days=366)
-        time.append(day + dayfrac)
+    matlab_dn = np.asarray(matlab_dn, dtype=np.float64)
+    # Whole days since 1/1/1970, and microseconds into the day (rounded
+    # the same way as `timedelta`)
+    days = np.trunc(matlab_dn).astype(np.int64) - 366 - \
+        datetime(1970, 1, 1).toordinal()
+    usec = np.round((matlab_dn % 1) * (24*60*60*1e6)).astype(np.int64)
+    time = (days * (24*60*60*1000000) + usec).astype('datetime64[us]')
         
-    return time
+    return time.astype(object).tolist()
 
 
 def _fullyear(year):
@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 #from scipy.signal import medfilt2d, convolve2d
 
 
@@ -18,6 +19,17 @@ def find(arr):
     return np.nonzero(np.ravel(arr))[0]
 
 
+@lru_cache(maxsize=None)
+def _detrend_x(n):
+    # The centered index vector for `detrend`, and the mean of its
+    # square. These depend only on the length, so they are computed
+    # once for each length (they are read-only).
+    x = np.arange(n, dtype=np.float_)
+    x -= x.mean()
+    x.flags.writeable = False
+    return x, (x ** 2).mean()
+
+
 def detrend(arr, axis=-1, in_place=False):
     """Remove a linear trend from arr.
 
@@ -43,11 +55,10 @@ def detrend(arr, axis=-1, in_place=False):
         arr = arr.copy()
     sz = np.ones(arr.ndim, dtype=int)
     sz[axis] = arr.shape[axis]
-    x = np.arange(sz[axis], dtype=np.float_).reshape(sz)
-    x -= x.mean(axis=axis, keepdims=True)
+    x, x2 = _detrend_x(sz[axis])
+    x = x.reshape(sz)
     arr -= arr.mean(axis=axis, keepdims=True)
-    b = (x * arr).mean(axis=axis, keepdims=True) / (x ** 2).mean(axis=axis,
-                                                                 keepdims=True)
+    b = (x * arr).mean(axis=axis, keepdims=True) / x2
     arr -= b * x
     return arr
 
@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 from .misc import detrend
 fft = np.fft.fft
 
@@ -33,11 +34,24 @@ def psd_freq(nfft, fs, full=False):
         return np.abs(f[1:int(nfft / 2. + 1)])
 
 
-def _getwindow(window, nfft):
+@lru_cache(maxsize=None)
+def _cached_window(window, nfft):
+    # The psd functions are called for every bin, so the named windows
+    # are cached (read-only; see `_getwindow`).
     if window == 'hann':
         window = np.hanning(nfft)
-    elif window is None or window == 1:
+    else:
         window = np.ones(nfft)
+    window.flags.writeable = False
+    return window
+
+
+def _getwindow(window, nfft):
+    if isinstance(window, np.ndarray):
+        return window
+    if window == 'hann' or window is None or window == 1:
+        # Return a copy, so that callers may modify it in-place.
+        return _cached_window(window, nfft).copy()
     return window
 
 
@@ -77,6 +91,20 @@ def _stepsize(l, nfft, nens=None, step=None):
         return int((l - nfft) / (nens - 1)), int(nens), int(nfft)
 
 
+def _segment_ffts(a, nfft, step, nens, window):
+    """
+    Yield the fft (positive frequencies only) of each detrended and
+    windowed `nfft`-point segment of `a`, starting every `step` points.
+
+    This is the segment loop shared by the spectral functions below.
+    """
+    fft_inds = slice(1, int(nfft / 2. + 1))
+    yield fft(detrend(a[0:nfft]) * window)[fft_inds]
+    if nens - 1:
+        for i in range(step, len(a) - nfft + 1, step):
+            yield fft(detrend(a[i:(i + nfft)]) * window)[fft_inds]
+
+
 def cohere(a, b, nfft, window='hann', debias=True, noise=(0, 0)):
     """
     Computes the magnitude-squared coherence of `a` and `b`.
@@ -120,10 +148,7 @@ def cohere(a, b, nfft, window='hann', debias=True, noise=(0, 0)):
 
     """
     l = [len(a), len(b)]
-    cross = cpsd_quasisync
-    if l[0] == l[1]:
-        cross = cpsd
-    elif l[0] > l[1]:
+    if l[0] > l[1]:
         a, b = b, a
         l = l[::-1]
     step1, nens, nfft = _stepsize(l[0], nfft)
@@ -136,9 +161,17 @@ def cohere(a, b, nfft, window='hann', debias=True, noise=(0, 0)):
         raise Exception("Coherence must be computed from a set of ensembles.")
     # fs=1 is ok because it comes out in the normalization.  (noise
     # normalization depends on this)
-    out = ((np.abs(cross(a, b, nfft, 1, window=window)) ** 2) /
-           ((psd(a, nfft, 1, window=window, step=step1) - noise[0] ** 2 / np.pi) *
-            (psd(b, nfft, 1, window=window, step=step2) - noise[1] ** 2 / np.pi))
+    if l[0] == l[1]:
+        # The cross- and auto-spectra share the same segments, so
+        # compute them from the same ffts.
+        Sab, Saa, Sbb = _cpsd_all(a, b, nfft, 1, window=window)
+    else:
+        Sab = cpsd_quasisync(a, b, nfft, 1, window=window)
+        Saa = psd(a, nfft, 1, window=window, step=step1)
+        Sbb = psd(b, nfft, 1, window=window, step=step2)
+    out = ((np.abs(Sab) ** 2) /
+           ((Saa - noise[0] ** 2 / np.pi) *
+            (Sbb - noise[1] ** 2 / np.pi))
            )
     if debias:
         # This is from Benignus1969, it seems to work (make data with different
@@ -223,16 +256,13 @@ def cpsd_quasisync(a, b, nfft, fs, window='hann'):
     step[1], nens, nfft = _stepsize(l[1], nfft, nens=nens)
     fs = np.float64(fs)
     window = _getwindow(window, nfft)
-    fft_inds = slice(1, int(nfft / 2. + 1))
     wght = 2. / (window ** 2).sum()
-    pwr = fft(detrend(a[0:nfft]) * window)[fft_inds] * \
-        np.conj(fft(detrend(b[0:nfft]) * window)[fft_inds])
-    #print(pwr.dtype)
-    if nens - 1:
-        for i1, i2 in zip(range(step[0], l[0] - nfft + 1, step[0]),
-                          range(step[1], l[1] - nfft + 1, step[1])):
-            pwr += fft(detrend(a[i1:(i1 + nfft)]) * window)[fft_inds] * \
-                np.conj(fft(detrend(b[i2:(i2 + nfft)]) * window)[fft_inds])
+    pwrs = (s1 * np.conj(s2) for s1, s2 in
+            zip(_segment_ffts(a, nfft, step[0], nens, window),
+                _segment_ffts(b, nfft, step[1], nens, window)))
+    pwr = next(pwrs)
+    for p in pwrs:
+        pwr += p
     pwr *= wght / nens / fs
     return pwr
 
@@ -312,27 +342,58 @@ def cpsd(a, b, nfft, fs, window='hann', step=None):
     step, nens, nfft = _stepsize(l, nfft, step=step)
     fs = np.float64(fs)
     window = _getwindow(window, nfft)
-    fft_inds = slice(1, int(nfft / 2. + 1))
     wght = 2. / (window ** 2).sum()
-    s1 = fft(detrend(a[0:nfft]) * window)[fft_inds]
+    s1s = _segment_ffts(a, nfft, step, nens, window)
     if auto_psd:
-        pwr = np.abs(s1) ** 2
+        pwrs = (np.abs(s1) ** 2 for s1 in s1s)
     else:
-        pwr = s1 * np.conj(fft(detrend(b[0:nfft]) * window)[fft_inds])
-    if nens - 1:
-        for i in range(step, l - nfft + 1, step):
-            # print( (i) )
-            s1 = fft(detrend(a[i:(i + nfft)]) * window)[fft_inds]
-            if auto_psd:
-                pwr += np.abs(s1) ** 2
-            else:
-                pwr += s1 * np.conj(fft(detrend(b[i:(i + nfft)]) * window)[fft_inds])
+        pwrs = (s1 * np.conj(s2) for s1, s2 in
+                zip(s1s, _segment_ffts(b, nfft, step, nens, window)))
+    pwr = next(pwrs)
+    for p in pwrs:
+        pwr += p
     pwr *= wght / nens / fs
     # print( 1,step,nens,l,nfft,wght,fs )
     # error
     return pwr
 
 
+def _cpsd_all(a, b, nfft, fs, window='hann'):
+    """
+    Compute the cross power spectral density of `a` and `b`, and the
+    power spectral densities of each, from one set of ffts.
+
+    This returns the same values as ``(cpsd(a, b, ...), psd(a, ...,
+    step=step), psd(b, ..., step=step))`` where `step` is the default
+    step size, but each segment of `a` and `b` is only detrended and
+    transformed once. The signals must be the same length.
+    """
+    if np.iscomplexobj(a) or np.iscomplexobj(b):
+        raise Exception ("Velocity cannot be complex")
+    l = len(a)
+    step, nens_ab, nfft = _stepsize(l, nfft)
+    # When `step` is rounded down, psd counts more ensembles than cpsd
+    # does for the same segments.
+    nens = _stepsize(l, nfft, step=step)[1] if step else nens_ab
+    fs = np.float64(fs)
+    window = _getwindow(window, nfft)
+    wght = 2. / (window ** 2).sum()
+    segs = zip(_segment_ffts(a, nfft, step, nens_ab, window),
+               _segment_ffts(b, nfft, step, nens_ab, window))
+    s1, s2 = next(segs)
+    pab = s1 * np.conj(s2)
+    paa = np.abs(s1) ** 2
+    pbb = np.abs(s2) ** 2
+    for s1, s2 in segs:
+        pab += s1 * np.conj(s2)
+        paa += np.abs(s1) ** 2
+        pbb += np.abs(s2) ** 2
+    pab *= wght / nens_ab / fs
+    paa *= wght / nens / fs
+    pbb *= wght / nens / fs
+    return pab, paa, pbb
+
+
 def psd(a, nfft, fs, window='hann', step=None):
     """
     Compute the power spectral density (PSD).
@@ -176,11 +176,12 @@ class Velocity():
 
         Ratio of sqrt(tke) to horizontal velocity magnitude.
         """
-        I_tke = np.ma.masked_where(self.U_mag < thresh,
-                                   np.sqrt(2 * self.tke) / self.U_mag)
+        U_mag = self.U_mag
+        I_tke = np.ma.masked_where(U_mag < thresh,
+                                   np.sqrt(2 * self.tke) / U_mag)
         return xr.DataArray(I_tke.data, 
-                            coords=self.U_mag.coords, 
-                            dims=self.U_mag.dims,
+                            coords=U_mag.coords, 
+                            dims=U_mag.dims,
                             attrs={'units':'% [0,1]'},
                             name='TKE intensity')
     @property
@@ -190,11 +191,12 @@ class Velocity():
         Ratio of standard deviation of horizontal velocity std dev
         to horizontal velocity magnitude.
         """
-        I = np.ma.masked_where(self.U_mag < thresh,
-                                  self.ds['U_std'] / self.U_mag)
+        U_mag = self.U_mag
+        I = np.ma.masked_where(U_mag < thresh,
+                                  self.ds['U_std'] / U_mag)
         return xr.DataArray(I.data, 
-                            coords=self.U_mag.coords, 
-                            dims=self.U_mag.dims,
+                            coords=U_mag.coords, 
+                            dims=U_mag.dims,
                             attrs={'units':'% [0,1]'},
                             name='turbulence intensity')
     @property
@@ -405,12 +407,11 @@ class VelBinner(TimeBinner):
         out = np.empty(self._outshape(vel[:3].shape)[:-1],
                        dtype=np.float32)
         
+        # Each component appears in two of the pairs, so demean them once
+        dv = self._demean(vel[:3]) # originally self.detrend
         for idx, p in enumerate(self._cross_pairs):
-            out[idx] = np.mean(
-                self._demean(vel[p[0]]) * # originally self.detrend
-                self._demean(vel[p[1]]),  # originally self.detrend
-                -1, dtype=np.float64
-            ).astype(np.float32)
+            out[idx] = np.mean(dv[p[0]] * dv[p[1]],
+                               -1, dtype=np.float64).astype(np.float32)
         
         da = xr.DataArray(out, name='stress_vec',
                           dims=veldat.dims,
@@ -1,7 +1,6 @@
 # Start by importing DOLfYN:
 import dolfyn as dlfn
 import dolfyn.adp.api as apm
-import matplotlib.pyplot as plt
 
 # Then read a file containing adv data:
 dat = dlfn.read_example('BenchFile01.ad2cp')
@@ -28,8 +27,13 @@ dlfn.save(dat_bin, 'adcp_data.nc')
 # And reload the data:
 dat_bin_copy = dlfn.load('adcp_data.nc')
 
-plt.figure()
-plt.pcolormesh(dat_bin.time, dat_bin.range, dat_bin.Veldata.U_mag)
-plt.colorbar()
-plt.ylabel('Range [m]')
-plt.xlabel('Time')
\ No newline at end of file
+# Plot the averaged velocity magnitude (only when run as a script, so
+# that importing this example doesn't load matplotlib):
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
+    plt.figure()
+    plt.pcolormesh(dat_bin.time, dat_bin.range, dat_bin.Veldata.U_mag)
+    plt.colorbar()
+    plt.ylabel('Range [m]')
+    plt.xlabel('Time')
@@ -42,7 +42,9 @@ config = dict(
     #           'dolfyn.rotate', 'dolfyn.tools', 'dolfyn.adp', ],
     package_data={},
     install_requires=['numpy', 'scipy', 'xarray'],
-    extras_require={'save':['h5netcdf']},
+    extras_require={'save': ['h5netcdf'],
+                    'numba': ['numba'],
+                    'test': ['h5netcdf', 'pytest']},
     provides=['dolfyn', ],
     scripts=['scripts/motcorrect_vector.py', 'scripts/vec2mat.py'], 
 )